@@ -39,6 +39,7 @@ pub(super) fn dispatch(matches: &clap::ArgMatches) -> Result<()> {
     script.raw(MAIN);
 
     stream.write_all(script.as_bytes())?;
+    stream.flush()?;
 
     Ok(())
 }
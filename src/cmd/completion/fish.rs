@@ -37,6 +37,7 @@ pub(super) fn dispatch(matches: &clap::ArgMatches) -> Result<()> {
     }
 
     stream.write_all(script.as_bytes())?;
+    stream.flush()?;
 
     Ok(())
 }
@@ -68,15 +68,18 @@ pub(super) fn dispatch(matches: &clap::ArgMatches) -> Result<()> {
     match matches.subcommand() {
         Some(("aliases", sub_matches)) => {
             let show_expansion = sub_matches.get_flag("show-expansion");
-            list_aliases(&mut output, style, show_expansion)
+            list_aliases(&mut output, style, show_expansion)?;
         }
-        Some(("commands", _)) => list_commands(&mut output, style),
+        Some(("commands", _)) => list_commands(&mut output, style)?,
         Some(("commands-and-aliases", _)) => {
             list_commands(&mut output, style)?;
-            list_aliases(&mut output, style, false)
+            list_aliases(&mut output, style, false)?;
         }
         _ => panic!("valid subcommand is required"),
     }
+
+    output.flush()?;
+    Ok(())
 }
 
 fn list_aliases(
@@ -57,15 +57,19 @@ fn run(matches: &clap::ArgMatches) -> Result<()> {
     }
 }
 
+/// Get buffered output stream for either the `--output` file or stdout.
+///
+/// The returned stream must be flushed by the caller in order for write errors to be
+/// reported.
 pub(self) fn get_output_stream(matches: &clap::ArgMatches) -> Result<Box<dyn std::io::Write>> {
     Ok(match matches.get_one::<PathBuf>("output") {
-        Some(path) => Box::new(
+        Some(path) => Box::new(std::io::BufWriter::new(
             std::fs::OpenOptions::new()
                 .create(true)
                 .truncate(true)
                 .write(true)
                 .open(path)?,
-        ) as Box<dyn std::io::Write>,
-        None => Box::new(std::io::stdout()),
+        )) as Box<dyn std::io::Write>,
+        None => Box::new(std::io::BufWriter::new(std::io::stdout().lock())),
     })
 }
@@ -24,5 +24,6 @@ pub(super) fn dispatch(matches: &clap::ArgMatches) -> Result<()> {
     let mut stream = super::get_output_stream(matches)?;
     let script = include_str!("../../../completion/stgit.zsh");
     stream.write_all(script.as_bytes())?;
+    stream.flush()?;
     Ok(())
 }
@@ -286,13 +286,10 @@ fn run(matches: &clap::ArgMatches) -> Result<()> {
             stdout.write_all(&specialized)?;
             stdout.write_all(&diff)?;
         } else {
-            let mut file = std::fs::File::options()
-                .write(true)
-                .create(true)
-                .open(output_dir.join(&patchfile_name))
-                .with_context(|| format!("opening {patchfile_name}"))?;
-            file.write_all(&specialized)?;
-            file.write_all(&diff)?;
+            let mut contents = specialized;
+            contents.extend_from_slice(&diff);
+            std::fs::write(output_dir.join(&patchfile_name), contents)
+                .with_context(|| format!("writing {patchfile_name}"))?;
         }
     }
 
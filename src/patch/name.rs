@@ -100,7 +100,13 @@ impl PatchName {
         }
 
         if lower {
-            name = name.to_lowercase();
+            // Lowercase in place for the common all-ascii case instead of allocating a
+            // second string.
+            if name.is_ascii() {
+                name.make_ascii_lowercase();
+            } else {
+                name = name.to_lowercase();
+            }
         }
 
         let mut candidate = name.as_str();
@@ -272,10 +278,9 @@ impl FromStr for PatchName {
     type Err = Error;
 
     fn from_str(name: &str) -> Result<Self, Self::Err> {
-        let name = if name.starts_with("\\-") {
-            name.strip_prefix('\\').unwrap()
-        } else {
-            name
+        let name = match name.strip_prefix('\\') {
+            Some(unescaped) if unescaped.starts_with('-') => unescaped,
+            _ => name,
         };
         Self::validate(name).map(|_| Self(name.into()))
     }
@@ -379,6 +384,7 @@ mod tests {
             ),
             ("__-__", "__-__", Some(10)),
             ("the name", "the-name", None),
+            ("Ärger Über", "ärger-über", None),
             // Long names are only shortened at '-' word boundaries.
             ("superlongname", "superlongname", Some(6)),
             ("super-longname", "super", Some(6)),
@@ -546,8 +546,8 @@ impl<'s> HeaderEntry<'s> {
         let branch_prefix = b"# branch.";
         let stash_prefix = b"# stash ";
         let raw_entry = &self.data[self.range.clone()];
-        if raw_entry.starts_with(branch_prefix) {
-            let mut name_value_split = raw_entry[branch_prefix.len()..].splitn_str(2, b" ");
+        if let Some(branch_entry) = raw_entry.strip_prefix(branch_prefix) {
+            let mut name_value_split = branch_entry.splitn_str(2, b" ");
             let header_name = name_value_split
                 .next()
                 .expect("something comes after \"# branch.\"");
@@ -561,8 +561,8 @@ impl<'s> HeaderEntry<'s> {
                 b"ab" => (HeaderKind::BranchAheadBehind, value),
                 _ => (HeaderKind::Ignored, raw_entry),
             }
-        } else if raw_entry.starts_with(stash_prefix) {
-            (HeaderKind::Stash, &raw_entry[stash_prefix.len()..])
+        } else if let Some(stash_value) = raw_entry.strip_prefix(stash_prefix) {
+            (HeaderKind::Stash, stash_value)
         } else {
             (HeaderKind::Ignored, raw_entry)
         }
@@ -44,14 +44,16 @@ pub(crate) fn get_template(
 
     for template_path in &template_paths {
         if let Ok(template_bytes) = std::fs::read(template_path) {
-            let template = std::str::from_utf8(&template_bytes).map_err(|_| {
+            // Take ownership of the read buffer rather than copying it into a new
+            // String after validation.
+            let template = String::from_utf8(template_bytes).map_err(|_| {
                 anyhow!(
                     "template file `{}` contains non-UTF-8 data",
                     template_path.display()
                 )
             })?;
 
-            return Ok(Some(template.into()));
+            return Ok(Some(template));
         }
     }
 
@@ -79,6 +79,15 @@ test_expect_success 'Export numbered patches with custom extension' '
     grep -e "02-patch-2\.mydiff" export5/series
 '
 
+test_expect_success 'Re-export shortened patch over existing export' '
+    stg edit -m "patch-1 with a much longer description to be shortened later" patch-1 &&
+    stg export -d export7 patch-1 &&
+    stg edit -m "patch-1" patch-1 &&
+    stg export -d export7 patch-1 &&
+    stg export --stdout patch-1 >expected &&
+    test_cmp expected export7/patch-1
+'
+
 test_expect_success 'Export series with empty patch' '
     stg new -m patch-6 &&
     stg export -d export6 &&